@@ -2,7 +2,32 @@ import os
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, font
 import datetime
+import hashlib
+import json
+import random
 import re
+import threading
+import zlib
+
+# Delay after the last keystroke before the note being edited is autosaved
+AUTOSAVE_DELAY_MS = 1500
+
+# Near-duplicate detection: MinHash signatures split into LSH bands.
+# With 16 bands of 4 rows, pairs above roughly 50% similarity become candidates.
+MANIFEST_PATH = os.path.join("notes", "manifest.json")
+SHINGLE_SIZE = 5
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+MINHASH_PERMUTATIONS = MINHASH_BANDS * MINHASH_ROWS
+MINHASH_PRIME = (1 << 61) - 1
+DUPLICATE_THRESHOLD = 0.7
+
+# Fixed seed so cached signatures stay valid between runs
+_minhash_random = random.Random(42)
+MINHASH_COEFFICIENTS = [
+    (_minhash_random.randrange(1, MINHASH_PRIME), _minhash_random.randrange(0, MINHASH_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
 
 class NotesApp:
     def __init__(self, root):
@@ -44,6 +69,18 @@ class NotesApp:
         self.notes_data = []
         self.subjects = []
         
+        # Autosave state
+        self.autosave_job = None
+        self.saved_hash = None
+        self.written_hash = None
+        self.edit_snapshot = None
+        self.autosave_new_subject = None
+        self.pending_writes = {}
+        self.autosave_failed = False
+        self.save_lock = threading.Lock()
+        self.generation_lock = threading.Lock()
+        self.save_generations = {}
+        
         # Set up UI components
         self.setup_sidebar()
         self.setup_notes_list()
@@ -51,6 +88,9 @@ class NotesApp:
         
         # Load existing notes
         self.load_notes()
+        
+        # Flush any pending autosave before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def configure_styles(self):
         """Configure ttk styles for the application"""
@@ -145,6 +185,9 @@ class NotesApp:
         new_note_btn = ttk.Button(button_frame, text="➕ New Note", command=self.new_note, style="Primary.TButton")
         new_note_btn.pack(fill=tk.X, pady=5)
         
+        duplicates_btn = ttk.Button(button_frame, text="🧬 Find Duplicates", command=self.find_duplicates)
+        duplicates_btn.pack(fill=tk.X, pady=5)
+        
         # Separator
         separator = ttk.Separator(self.sidebar_frame, orient=tk.HORIZONTAL)
         separator.pack(fill=tk.X, padx=10, pady=10)
@@ -251,6 +294,7 @@ class NotesApp:
         ).pack(anchor=tk.W, padx=5, pady=(10, 0))
         
         self.subject_var = tk.StringVar()
+        self.subject_var.trace("w", self.on_subject_changed)
         self.subject_entry = ttk.Entry(self.note_edit_frame, textvariable=self.subject_var, font=("Segoe UI", 11))
         self.subject_entry.pack(fill=tk.X, padx=5, pady=5)
         
@@ -272,6 +316,7 @@ class NotesApp:
             foreground=self.colors["text_dark"]
         )
         self.content_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=10)
+        self.content_text.bind("<<Modified>>", self.on_content_modified)
         
         # Buttons frame
         buttons_frame = ttk.Frame(self.note_edit_frame, style="Content.TFrame")
@@ -283,6 +328,9 @@ class NotesApp:
         cancel_btn = ttk.Button(buttons_frame, text="❌ Cancel", command=self.cancel_edit)
         cancel_btn.pack(side=tk.LEFT, padx=5)
         
+        self.autosave_status = ttk.Label(buttons_frame, text="", style="NoteDate.TLabel")
+        self.autosave_status.pack(side=tk.RIGHT, padx=5)
+        
         # Note view frame (initially hidden)
         self.note_view_frame = ttk.Frame(self.content_frame, style="Content.TFrame")
         
@@ -333,7 +381,7 @@ class NotesApp:
         export_btn = ttk.Button(view_buttons_frame, text="📤 Export", command=self.export_note)
         export_btn.pack(side=tk.RIGHT, padx=5)
     
-    def create_note_item(self, note, index):
+    def create_note_item(self, note):
         """Create a styled note item for the notes list"""
         # Create a frame for the note item with padding and border
         item_frame = ttk.Frame(self.notes_items_frame, style="NotesList.TFrame")
@@ -393,7 +441,7 @@ class NotesApp:
         
         # Make the whole card clickable
         for widget in [card, inner_frame, subject_frame, subject_label, date_label, preview_label]:
-            widget.bind("<Button-1>", lambda e, idx=index: self.select_note_by_index(idx))
+            widget.bind("<Button-1>", lambda e, n=note: self.select_note(n))
             widget.bind("<Enter>", lambda e, f=card: self.on_card_hover(f, True))
             widget.bind("<Leave>", lambda e, f=card: self.on_card_hover(f, False))
     
@@ -413,6 +461,10 @@ class NotesApp:
         if not os.path.exists("notes"):
             os.makedirs("notes")
         
+        # Cached MinHash signatures keyed by note, reused while the content is unchanged
+        manifest = self.load_manifest()
+        new_manifest = {}
+        
         # Get all subject folders
         for subject_folder in os.listdir("notes"):
             folder_path = os.path.join("notes", subject_folder)
@@ -429,15 +481,30 @@ class NotesApp:
                         # Get creation date from file metadata
                         created_at = datetime.datetime.fromtimestamp(os.path.getctime(file_path))
                         
+                        # Reuse the cached signature if the content hasn't changed
+                        note_key = f"{subject_folder}/{note_file}"
+                        content_hash = self.hash_content(content)
+                        entry = manifest.get(note_key)
+                        if (not isinstance(entry, dict) or entry.get("hash") != content_hash
+                                or len(entry.get("minhash") or []) != MINHASH_PERMUTATIONS):
+                            entry = {"hash": content_hash, "minhash": self.compute_minhash(content)}
+                        new_manifest[note_key] = entry
+                        
                         # Add note to the list
                         self.notes_data.append({
                             "id": note_file[:-4],  # Remove .txt extension
                             "subject": subject_folder,
                             "content": content,
                             "created_at": created_at,
-                            "file_path": file_path
+                            "file_path": file_path,
+                            "minhash_hash": content_hash,
+                            "minhash": entry["minhash"]
                         })
         
+        # Only rewrite the manifest when a signature was added, changed or removed
+        if new_manifest != manifest:
+            self.save_manifest(new_manifest)
+        
         # Update the UI
         self.update_subjects_list()
         self.update_notes_list()
@@ -461,6 +528,9 @@ class NotesApp:
     
     def update_notes_list(self):
         """Update the notes list based on the current subject and search query"""
+        # Don't lose text typed just before leaving the editor
+        self.flush_autosave()
+        
         # Clear all note items
         for widget in self.notes_items_frame.winfo_children():
             widget.destroy()
@@ -484,8 +554,8 @@ class NotesApp:
         filtered_notes.sort(key=lambda x: x["created_at"], reverse=True)
         
         # Add notes to the list
-        for i, note in enumerate(filtered_notes):
-            self.create_note_item(note, i)
+        for note in filtered_notes:
+            self.create_note_item(note)
         
         # Update the header
         subject_text = self.current_subject if self.current_subject else "All Notes"
@@ -508,25 +578,13 @@ class NotesApp:
         """Search notes based on the search query"""
         self.update_notes_list()
     
-    def select_note_by_index(self, index):
-        """Select a note by its index in the filtered list"""
-        # Get the filtered notes
-        search_query = self.search_var.get().lower()
-        filtered_notes = []
+    def select_note(self, note):
+        """Select a note from the notes list"""
+        # Don't lose text typed just before leaving the editor
+        self.flush_autosave()
         
-        for note in self.notes_data:
-            if self.current_subject and note["subject"] != self.current_subject:
-                continue
-            if search_query and search_query not in note["subject"].lower() and search_query not in note["content"].lower():
-                continue
-            filtered_notes.append(note)
-        
-        # Sort notes by creation date (newest first)
-        filtered_notes.sort(key=lambda x: x["created_at"], reverse=True)
-        
-        if index < len(filtered_notes):
-            self.current_note = filtered_notes[index]
-            self.show_note_view()
+        self.current_note = note
+        self.show_note_view()
     
     def show_default_view(self):
         """Show the default view when no note is selected"""
@@ -571,9 +629,21 @@ class NotesApp:
             self.subject_var.set(self.current_note["subject"])
             self.content_text.delete(1.0, tk.END)
             self.content_text.insert(tk.END, self.current_note["content"])
+        
+        # Start tracking edits from the freshly loaded content
+        self.cancel_autosave()
+        self.content_text.edit_modified(False)
+        self.saved_hash = self.hash_content(self.current_note["content"]) if self.current_note else None
+        self.written_hash = self.saved_hash
+        self.edit_snapshot = self.current_note["content"] if self.current_note else None
+        self.autosave_new_subject = None
+        self.autosave_failed = False
+        self.autosave_status.config(text="")
     
     def new_note(self):
         """Create a new note"""
+        # Don't lose text typed just before leaving the editor
+        self.flush_autosave()
         self.current_note = None
         self.show_note_edit(is_new=True)
     
@@ -604,36 +674,80 @@ class NotesApp:
         if not os.path.exists(subject_folder):
             os.makedirs(subject_folder)
         
-        # Generate a unique ID for the note if it's new
-        if not self.current_note:
-            note_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-            file_path = os.path.join(subject_folder, f"{note_id}.txt")
-        else:
-            # If we're editing an existing note
-            if self.current_note["subject"] != valid_subject:
-                # Subject has changed, so we need to move the file
-                note_id = self.current_note["id"]
+        # An explicit save supersedes any pending autosave
+        self.cancel_autosave()
+        
+        with self.save_lock:
+            # Generate a unique ID for the note if it's new
+            if not self.current_note:
+                note_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
                 file_path = os.path.join(subject_folder, f"{note_id}.txt")
-                
-                # Delete the old file
-                if os.path.exists(self.current_note["file_path"]):
-                    os.remove(self.current_note["file_path"])
             else:
-                # Subject hasn't changed, use the existing file path
-                file_path = self.current_note["file_path"]
-        
-        # Save the note to the file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+                # If we're editing an existing note
+                if self.current_note["subject"] != valid_subject:
+                    # Subject has changed, so we need to move the file
+                    note_id = self.current_note["id"]
+                    file_path = os.path.join(subject_folder, f"{note_id}.txt")
+                    
+                    # Delete the old file, making sure an in-flight autosave can't recreate it
+                    self.invalidate_writes(self.current_note["file_path"])
+                    if os.path.exists(self.current_note["file_path"]):
+                        os.remove(self.current_note["file_path"])
+                elif (self.hash_content(content) == self.written_hash
+                      and not self.pending_writes.get(self.current_note["file_path"])):
+                    # The note on disk already has this content; keep in-flight autosaves from changing it
+                    self.invalidate_writes(self.current_note["file_path"])
+                    file_path = None
+                else:
+                    # Subject hasn't changed, use the existing file path
+                    file_path = self.current_note["file_path"]
+            
+            # Save the note to the file, superseding any in-flight autosave
+            if file_path:
+                self.invalidate_writes(file_path)
+                self.write_file_atomic(file_path, content)
         
-        # Reload all notes
-        self.load_notes()
+        if file_path:
+            # Reload all notes
+            self.load_notes()
+        else:
+            # The note is already on disk and in memory
+            self.update_notes_list()
         
         # Show the default view
         self.show_default_view()
     
     def cancel_edit(self):
-        """Cancel editing and return to the previous view"""
+        """Discard the changes made since editing started and return to the previous view"""
+        self.cancel_autosave()
+        
+        # Undo whatever autosave already wrote
+        if self.current_note and self.current_note["content"] != self.edit_snapshot:
+            file_path = self.current_note["file_path"]
+            with self.save_lock:
+                self.invalidate_writes(file_path)
+                if self.edit_snapshot is None:
+                    # Remove the file autosave created for this new note
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                else:
+                    self.write_file_atomic(file_path, self.edit_snapshot)
+            
+            if self.edit_snapshot is None:
+                self.notes_data.remove(self.current_note)
+                self.current_note = None
+                
+                # Remove the folder autosave created for the note's subject
+                if self.autosave_new_subject:
+                    try:
+                        os.rmdir(os.path.dirname(file_path))
+                    except OSError:
+                        pass
+                    self.subjects.remove(self.autosave_new_subject)
+                    self.update_subjects_list()
+            else:
+                self.current_note["content"] = self.edit_snapshot
+        
         if self.current_note:
             self.show_note_view()
         else:
@@ -648,9 +762,11 @@ class NotesApp:
         if not confirm:
             return
         
-        # Delete the file
-        if os.path.exists(self.current_note["file_path"]):
-            os.remove(self.current_note["file_path"])
+        # Delete the file, making sure an in-flight autosave can't recreate it
+        with self.save_lock:
+            self.invalidate_writes(self.current_note["file_path"])
+            if os.path.exists(self.current_note["file_path"]):
+                os.remove(self.current_note["file_path"])
         
         # Reload all notes
         self.load_notes()
@@ -658,6 +774,443 @@ class NotesApp:
         # Show the default view
         self.show_default_view()
     
+    def hash_content(self, content):
+        """Return a hash of note content used to detect unsaved changes"""
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+    
+    def on_content_modified(self, event=None):
+        """Schedule an autosave when the content text is edited"""
+        if not self.content_text.edit_modified():
+            return
+        
+        # Reset the flag so the next edit fires <<Modified>> again
+        self.content_text.edit_modified(False)
+        self.schedule_autosave()
+    
+    def schedule_autosave(self):
+        """Restart the autosave timer so it fires once typing pauses"""
+        self.cancel_autosave()
+        self.autosave_job = self.root.after(AUTOSAVE_DELAY_MS, self.autosave)
+    
+    def cancel_autosave(self):
+        """Cancel a pending autosave, if any"""
+        if self.autosave_job is not None:
+            self.root.after_cancel(self.autosave_job)
+            self.autosave_job = None
+    
+    def flush_autosave(self):
+        """Run a pending autosave immediately"""
+        if self.autosave_job is not None:
+            self.cancel_autosave()
+            self.autosave()
+    
+    def invalidate_writes(self, file_path):
+        """Make autosave writes to a file that are still in flight do nothing"""
+        with self.generation_lock:
+            generation = self.save_generations.get(file_path, 0) + 1
+            self.save_generations[file_path] = generation
+        return generation
+    
+    def write_file_atomic(self, file_path, content):
+        """Write to a temporary file first so a crash never truncates the target"""
+        temp_path = file_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_path, file_path)
+    
+    def on_subject_changed(self, *args):
+        """Schedule an autosave when the subject is edited"""
+        if self.note_edit_frame.winfo_manager():
+            self.schedule_autosave()
+    
+    def autosave(self):
+        """Write the note being edited to disk if its content has changed"""
+        self.autosave_job = None
+        
+        # Only autosave while the edit form is shown
+        if not self.note_edit_frame.winfo_manager():
+            return
+        
+        content = self.content_text.get(1.0, tk.END).strip()
+        if not content:
+            return
+        
+        # Skip the write entirely when the content matches what is on disk
+        content_hash = self.hash_content(content)
+        if content_hash == self.saved_hash:
+            return
+        
+        if not self.current_note:
+            # A new note needs a subject before it can be given a file
+            subject = self.subject_var.get().strip()
+            if not subject:
+                return
+            
+            valid_subject = re.sub(r'[\\/*?:"<>|]', "_", subject)
+            note_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+            self.current_note = {
+                "id": note_id,
+                "subject": valid_subject,
+                "content": content,
+                "created_at": datetime.datetime.now(),
+                "file_path": os.path.join("notes", valid_subject, f"{note_id}.txt")
+            }
+            self.notes_data.append(self.current_note)
+            if valid_subject not in self.subjects:
+                self.subjects.append(valid_subject)
+                self.autosave_new_subject = valid_subject
+                self.update_subjects_list()
+        
+        # Update the in-memory note now so the UI never waits on the disk
+        file_path = self.current_note["file_path"]
+        self.current_note["content"] = content
+        self.saved_hash = content_hash
+        
+        generation = self.invalidate_writes(file_path)
+        self.pending_writes[file_path] = self.pending_writes.get(file_path, 0) + 1
+        
+        threading.Thread(
+            target=self.write_note_file,
+            args=(file_path, content, content_hash, generation)
+        ).start()
+    
+    def write_note_file(self, file_path, content, content_hash, generation):
+        """Write note content to disk on a background thread"""
+        written = False
+        error = None
+        
+        # save_lock orders this write against explicit saves; autosave itself never waits on it
+        with self.save_lock:
+            # A newer autosave, save or delete has superseded this write
+            with self.generation_lock:
+                superseded = generation != self.save_generations.get(file_path)
+            
+            if not superseded:
+                try:
+                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                    self.write_file_atomic(file_path, content)
+                    written = True
+                except OSError as e:
+                    error = e
+        
+        # Tk state is only touched from the Tk thread
+        try:
+            self.root.after(0, self.on_note_write_done, file_path, content_hash, written, error)
+        except (RuntimeError, tk.TclError):
+            # The window was closed while the write was running
+            pass
+    
+    def on_note_write_done(self, file_path, content_hash, written, error):
+        """Record the result of a background autosave write"""
+        remaining = self.pending_writes.get(file_path, 0) - 1
+        if remaining > 0:
+            self.pending_writes[file_path] = remaining
+        else:
+            self.pending_writes.pop(file_path, None)
+        
+        is_current = self.current_note is not None and self.current_note["file_path"] == file_path
+        if error:
+            if is_current and self.note_edit_frame.winfo_manager():
+                # Keep retrying while the note is still open
+                self.saved_hash = None
+                self.autosave_failed = True
+                self.autosave_status.config(text="⚠️ Autosave failed, retrying...")
+                self.schedule_autosave()
+            else:
+                messagebox.showerror("Autosave Failed", f"Could not save note to {file_path}:\n{error}")
+        elif written and is_current:
+            self.written_hash = content_hash
+            self.autosave_failed = False
+            self.autosave_status.config(text="✔️ Autosaved")
+    
+    def load_manifest(self):
+        """Load the cached note signatures, or an empty manifest if unavailable"""
+        try:
+            with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+    
+    def save_manifest(self, manifest):
+        """Write the cached note signatures to the manifest file"""
+        temp_path = MANIFEST_PATH + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(temp_path, MANIFEST_PATH)
+        except OSError:
+            # The manifest is only a cache, so it is rebuilt on the next load
+            pass
+    
+    def shingle_content(self, content):
+        """Return the hashed character shingles of some text"""
+        text = " ".join(content.lower().split())
+        if not text:
+            return set()
+        
+        # Use a stable hash (not hash()) so signatures can be cached on disk
+        return {
+            zlib.crc32(text[i:i + SHINGLE_SIZE].encode("utf-8"))
+            for i in range(max(1, len(text) - SHINGLE_SIZE + 1))
+        }
+    
+    def compute_minhash(self, content):
+        """Compute the MinHash signature of a note's character shingles"""
+        shingles = self.shingle_content(content)
+        if not shingles:
+            return None
+        
+        return [
+            min((a * shingle + b) % MINHASH_PRIME for shingle in shingles)
+            for a, b in MINHASH_COEFFICIENTS
+        ]
+    
+    def get_minhash(self, note):
+        """Return a note's signature, recomputing it if the note was edited since loading"""
+        content_hash = self.hash_content(note["content"])
+        if note.get("minhash_hash") != content_hash:
+            note["minhash"] = self.compute_minhash(note["content"])
+            note["minhash_hash"] = content_hash
+        return note["minhash"]
+    
+    def estimate_similarity(self, signature_a, signature_b):
+        """Estimate the Jaccard similarity of two notes from their signatures"""
+        matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+        return matches / MINHASH_PERMUTATIONS
+    
+    def find_duplicate_groups(self):
+        """Group near-duplicate notes using locality-sensitive hashing"""
+        signatures = [self.get_minhash(note) for note in self.notes_data]
+        
+        # Notes that agree on every row of a band land in the same bucket
+        buckets = {}
+        for index, signature in enumerate(signatures):
+            if signature is None:
+                continue
+            for band in range(MINHASH_BANDS):
+                rows = tuple(signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS])
+                buckets.setdefault((band, rows), []).append(index)
+        
+        # Union-find over candidate pairs that pass the similarity check
+        parent = list(range(len(self.notes_data)))
+        
+        def find(index):
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+        
+        checked = set()
+        for members in buckets.values():
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    if (first, second) in checked:
+                        continue
+                    checked.add((first, second))
+                    if self.estimate_similarity(signatures[first], signatures[second]) >= DUPLICATE_THRESHOLD:
+                        parent[find(second)] = find(first)
+        
+        groups = {}
+        for index in range(len(self.notes_data)):
+            groups.setdefault(find(index), []).append(self.notes_data[index])
+        
+        # Keep only real groups, each sorted oldest first
+        duplicate_groups = [
+            sorted(group, key=lambda x: x["created_at"])
+            for group in groups.values()
+            if len(group) > 1
+        ]
+        duplicate_groups.sort(key=lambda group: group[0]["created_at"])
+        return duplicate_groups
+    
+    def find_duplicates(self):
+        """Show groups of near-duplicate notes with bulk merge and delete actions"""
+        # Make sure the note being edited is on disk and in notes_data
+        self.flush_autosave()
+        
+        groups = self.find_duplicate_groups()
+        if not groups:
+            messagebox.showinfo("Find Duplicates", "No near-duplicate notes found")
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("Near-Duplicate Notes")
+        window.geometry("700x550")
+        window.configure(bg=self.colors["bg_light"])
+        
+        # Keep the main window from changing the notes while the groups are shown
+        window.transient(self.root)
+        window.grab_set()
+        
+        header = ttk.Label(
+            window,
+            text=f"🧬 {len(groups)} group(s) of near-duplicates",
+            style="Subheader.TLabel"
+        )
+        header.pack(anchor=tk.W, padx=15, pady=(15, 0))
+        
+        ttk.Label(
+            window,
+            text="The oldest note in each group is kept; checked notes are merged into it or deleted.",
+            font=("Segoe UI", 9),
+            background=self.colors["bg_light"],
+            foreground=self.colors["text_light"]
+        ).pack(anchor=tk.W, padx=15, pady=(0, 10))
+        
+        # Action buttons
+        buttons_frame = ttk.Frame(window, style="Content.TFrame")
+        buttons_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=10)
+        
+        # Scrollable list of groups
+        list_frame = ttk.Frame(window, style="Content.TFrame")
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=5)
+        
+        canvas = tk.Canvas(list_frame, bg=self.colors["bg_light"], highlightthickness=0)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=canvas.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        groups_frame = ttk.Frame(canvas, style="Content.TFrame")
+        canvas.create_window((0, 0), window=groups_frame, anchor=tk.NW, width=640)
+        groups_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        
+        # Each group holds its kept note and the checkbox state of the others
+        selections = []
+        for group in groups:
+            keeper = group[0]
+            card = tk.Frame(
+                groups_frame,
+                bg="white",
+                bd=1,
+                relief=tk.SOLID,
+                highlightbackground=self.colors["bg_dark"],
+                highlightthickness=1
+            )
+            card.pack(fill=tk.X, padx=2, pady=4)
+            
+            tk.Label(
+                card,
+                text=f"📌 Keep: {keeper['subject']} – {keeper['created_at'].strftime('%m/%d/%Y')} – {keeper['content'][:60]}",
+                font=("Segoe UI", 10, "bold"),
+                bg="white",
+                fg=self.colors["primary"],
+                anchor=tk.W,
+                justify=tk.LEFT,
+                wraplength=600
+            ).pack(fill=tk.X, padx=8, pady=(8, 4))
+            
+            keeper_signature = self.get_minhash(keeper)
+            duplicates = []
+            for note in group[1:]:
+                similarity = self.estimate_similarity(keeper_signature, self.get_minhash(note))
+                # Groups are built from chains of matches, so only pre-check notes close to the kept one
+                var = tk.BooleanVar(value=similarity >= DUPLICATE_THRESHOLD)
+                tk.Checkbutton(
+                    card,
+                    text=f"{note['subject']} – {note['created_at'].strftime('%m/%d/%Y')} – {similarity:.0%} similar – {note['content'][:50]}",
+                    variable=var,
+                    font=("Segoe UI", 9),
+                    bg="white",
+                    fg=self.colors["text_dark"],
+                    anchor=tk.W,
+                    justify=tk.LEFT,
+                    wraplength=580
+                ).pack(fill=tk.X, padx=20, pady=1)
+                duplicates.append((note, var))
+            tk.Frame(card, bg="white", height=6).pack(fill=tk.X)
+            
+            selections.append((keeper, duplicates))
+        
+        merge_btn = ttk.Button(
+            buttons_frame,
+            text="🔗 Merge Selected",
+            command=lambda: self.resolve_duplicates(window, selections, merge=True),
+            style="Secondary.TButton"
+        )
+        merge_btn.pack(side=tk.LEFT, padx=5)
+        
+        delete_btn = ttk.Button(
+            buttons_frame,
+            text="🗑️ Delete Selected",
+            command=lambda: self.resolve_duplicates(window, selections, merge=False),
+            style="Accent.TButton"
+        )
+        delete_btn.pack(side=tk.LEFT, padx=5)
+        
+        close_btn = ttk.Button(buttons_frame, text="❌ Close", command=window.destroy)
+        close_btn.pack(side=tk.RIGHT, padx=5)
+    
+    def resolve_duplicates(self, window, selections, merge):
+        """Merge checked duplicates into the kept note of each group, or delete them"""
+        selected = [
+            (keeper, [note for note, var in duplicates if var.get()])
+            for keeper, duplicates in selections
+        ]
+        selected = [(keeper, notes) for keeper, notes in selected if notes]
+        count = sum(len(notes) for _, notes in selected)
+        if not count:
+            messagebox.showinfo("Find Duplicates", "No notes selected", parent=window)
+            return
+        
+        if merge:
+            message = (f"Merge {count} selected note(s)? Every paragraph the kept note doesn't already contain "
+                       "word for word, including edited versions of its own paragraphs, will be appended to it, "
+                       "and the selected notes will be deleted.")
+        else:
+            message = f"Are you sure you want to delete {count} selected note(s)?"
+        confirm = messagebox.askyesno("Confirm", message, parent=window)
+        if not confirm:
+            return
+        
+        # Write out pending edits first; only writes to the affected notes are invalidated below
+        self.flush_autosave()
+        
+        with self.save_lock:
+            for keeper, notes in selected:
+                for note in [keeper] + notes:
+                    self.invalidate_writes(note["file_path"])
+                
+                if merge:
+                    # Append every paragraph the kept note doesn't already contain, ignoring
+                    # whitespace only, so edits made in the duplicates are never dropped
+                    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", keeper["content"]) if p.strip()]
+                    seen = {" ".join(p.split()) for p in paragraphs}
+                    for note in notes:
+                        for paragraph in re.split(r"\n\s*\n", note["content"]):
+                            paragraph = paragraph.strip()
+                            normalized = " ".join(paragraph.split())
+                            if paragraph and normalized not in seen:
+                                paragraphs.append(paragraph)
+                                seen.add(normalized)
+                    
+                    self.write_file_atomic(keeper["file_path"], "\n\n".join(paragraphs))
+                
+                for note in notes:
+                    if os.path.exists(note["file_path"]):
+                        os.remove(note["file_path"])
+        
+        window.destroy()
+        
+        # Reload all notes
+        self.load_notes()
+    
+    def on_close(self):
+        """Flush a pending autosave and close the application"""
+        self.flush_autosave()
+        
+        if self.autosave_failed:
+            confirm = messagebox.askyesno(
+                "Unsaved Changes",
+                "The note being edited could not be saved. Close anyway and lose the unsaved changes?"
+            )
+            if not confirm:
+                return
+        
+        self.root.destroy()
+    
     def export_note(self):
         """Export the current note to a text file in a user-specified location"""
         if not self.current_note: